@@ -10,7 +10,11 @@ A Python GUI application that allows users to:
 - Save plots as PNG or SVG
 """
 
+import os
+import pickle
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Tuple, List
 from pathlib import Path
 
@@ -22,12 +26,19 @@ from PyQt6.QtWidgets import (
     QFileDialog, QMessageBox, QGroupBox, QCheckBox, QLineEdit,
     QSplitter, QScrollArea, QFrame, QDoubleSpinBox, QStatusBar
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction
 
+import matplotlib
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+try:
+    import numba
+except ImportError:  # optional, speeds up decimation
+    numba = None
 
 # Configuration constants
 MAX_BAR_CHART_ITEMS = 50
@@ -35,37 +46,239 @@ DEFAULT_PLOT_DPI = 150
 LEFT_PANEL_MAX_WIDTH = 400
 LEFT_PANEL_INITIAL_WIDTH = 350
 PLOT_PANEL_INITIAL_WIDTH = 850
+JOIN_TYPES = {"Inner Join": "inner", "Outer Join": "outer", "Left Join": "left"}
+DECIMATION_TARGET = 4000
+RASTERIZE_MIN_POINTS = 20000
+# Copy-on-Write makes concat copy-free from pandas 3, which deprecates `copy`
+CONCAT_NO_COPY = {"copy": False} if int(pd.__version__.split(".")[0]) < 3 else {}
+LARGE_CSV_BYTES = 100 * 1024 * 1024
+CSV_CHUNK_ROWS = 1_000_000
+CONFIG_DEBOUNCE_MS = 80
+MAX_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+
+def _is_monotonic_numeric(x_data) -> bool:
+    """Check whether X data is numeric and sorted in ascending order."""
+    if not pd.api.types.is_numeric_dtype(x_data) or pd.api.types.is_bool_dtype(x_data):
+        return False
+    return bool(pd.Index(x_data).is_monotonic_increasing)
+
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True)
+    def _minmax_kernel(y, bins, bin_size, out_idx):
+        """Write the argmin, argmax and first NaN (or -1) of each bin of y into out_idx."""
+        n = len(y)
+        for b in numba.prange(bins):
+            start = b * bin_size
+            stop = min(start + bin_size, n)
+            lo = start
+            hi = start
+            first_nan = -1
+            lo_val = np.inf
+            hi_val = -np.inf
+            for i in range(start, stop):
+                v = y[i]
+                if np.isnan(v):
+                    if first_nan < 0:
+                        first_nan = i
+                    continue
+                if v < lo_val:
+                    lo_val = v
+                    lo = i
+                if v > hi_val:
+                    hi_val = v
+                    hi = i
+            out_idx[3 * b] = lo
+            out_idx[3 * b + 1] = hi
+            out_idx[3 * b + 2] = first_nan
+else:
+    _minmax_kernel = None
+
+
+def _decimate(x: np.ndarray, y: np.ndarray,
+              target: int = DECIMATION_TARGET) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce a series to about `target` points.
+
+    Keeps the first and last points, each bin's min and max, and a NaN from
+    every bin that has one so gaps in the line are preserved.
+    """
+    n = len(y)
+    if n <= target:
+        return x, y
+    bin_size = -(-n // (target // 2))
+    bins = -(-n // bin_size)
+    if _minmax_kernel is not None:
+        out_idx = np.empty(3 * bins, dtype=np.int64)
+        _minmax_kernel(np.ascontiguousarray(y, dtype=np.float64), bins, bin_size, out_idx)
+        idx = np.unique(np.concatenate([[0, n - 1], out_idx[out_idx >= 0]]))
+        return x[idx], y[idx]
+    pad = bins * bin_size - n
+    nan = np.isnan(y)
+    low = np.concatenate([np.where(nan, np.inf, y), np.full(pad, np.inf)])
+    high = np.concatenate([np.where(nan, -np.inf, y), np.full(pad, -np.inf)])
+    nan_bins = np.concatenate([nan, np.zeros(pad, dtype=bool)]).reshape(bins, bin_size)
+    starts = np.arange(bins) * bin_size
+    has_nan = nan_bins.any(axis=1)
+    idx = np.concatenate([
+        [0, n - 1],
+        starts + low.reshape(bins, bin_size).argmin(axis=1),
+        starts + high.reshape(bins, bin_size).argmax(axis=1),
+        starts[has_nan] + nan_bins[has_nan].argmax(axis=1),
+    ])
+    idx = np.unique(idx)
+    return x[idx], y[idx]
 
 
 class DataManager:
     """Manages loaded CSV data and merging operations."""
 
-    def __init__(self):
+    def __init__(self, use_arrow: bool = True):
+        self.use_arrow = use_arrow
         self.dataframes: Dict[str, pd.DataFrame] = {}
-        self.merged_data: Optional[pd.DataFrame] = None
+        # Number of loaded dataframes containing each column name
+        self._col_counts: Counter = Counter()
+        self._merged_data: Optional[pd.DataFrame] = None
+        self._merged_cols: Tuple[str, ...] = ()
+        self._numeric_cols: Tuple[str, ...] = ()
+        self._index_arr: Optional[np.ndarray] = None
+
+    @property
+    def merged_data(self) -> Optional[pd.DataFrame]:
+        """The merged dataframe, or None before the first merge."""
+        return self._merged_data
+
+    @merged_data.setter
+    def merged_data(self, data: Optional[pd.DataFrame]):
+        self._merged_data = data
+        if data is None:
+            self._merged_cols = ()
+            self._numeric_cols = ()
+            self._index_arr = None
+        else:
+            self._merged_cols = tuple(data.columns)
+            self._numeric_cols = tuple(data.select_dtypes(include=[np.number]).columns)
+            self._index_arr = data.index.to_numpy()
 
     def load_csv(self, filepath: str) -> Tuple[bool, str]:
         """Load a CSV file and store it with a unique name."""
         try:
-            df = pd.read_csv(filepath)
-            path = Path(filepath)
-            stem = path.stem  # filename without extension
-            suffix = path.suffix  # file extension including dot
-            filename = path.name
-            # Ensure unique name by inserting counter before extension
-            counter = 1
-            while filename in self.dataframes:
-                filename = f"{stem}_{counter}{suffix}"
-                counter += 1
-            self.dataframes[filename] = df
-            return True, filename
+            df = self._read_csv(filepath)
+            return True, self._store(filepath, df)
         except Exception as e:
             return False, str(e)
 
+    def load_many(self, filepaths: List[str]) -> List[Tuple[str, bool, str]]:
+        """Load several CSV files in parallel.
+
+        Parsing runs on a thread pool; names are assigned afterwards in the
+        order the files were given. Returns (filepath, success, result) tuples.
+        """
+        results = []
+        if not filepaths:
+            return results
+        workers = min(MAX_LOAD_WORKERS, len(filepaths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._read_csv, fp) for fp in filepaths]
+            for filepath, future in zip(filepaths, futures):
+                try:
+                    df = future.result()
+                    results.append((filepath, True, self._store(filepath, df)))
+                except Exception as e:
+                    results.append((filepath, False, str(e)))
+        return results
+
+    def _read_csv(self, filepath: str) -> pd.DataFrame:
+        """Read a CSV file.
+
+        Uses the pyarrow engine when enabled and installed, falling back to
+        the C engine, which reads files above LARGE_CSV_BYTES in chunks. The
+        chunks are joined at the end, so this bounds the parser's working
+        memory but not the peak, which still holds the chunks and the result.
+        """
+        if self.use_arrow:
+            try:
+                df = self._read_csv_arrow(filepath)
+            except (ImportError, ValueError):
+                df = None
+            if df is not None:
+                return df
+        if os.path.getsize(filepath) <= LARGE_CSV_BYTES:
+            return pd.read_csv(filepath)
+        chunks = list(pd.read_csv(filepath, chunksize=CSV_CHUNK_ROWS, low_memory=True))
+        if not chunks:
+            return pd.read_csv(filepath)
+        df = pd.concat(chunks, ignore_index=True, **CONCAT_NO_COPY)
+        # Each chunk infers its own dtypes; columns holding text in some
+        # chunks are re-read as text, which is what a full read gives
+        mixed = [
+            col for col in df.columns
+            if len({chunk[col].dtype for chunk in chunks}) > 1
+            and any(pd.api.types.infer_dtype(chunk[col], skipna=True)
+                    in ("string", "mixed", "mixed-integer") for chunk in chunks)
+        ]
+        if mixed:
+            df[mixed] = pd.read_csv(filepath, usecols=mixed, dtype=str)[mixed]
+        return df
+
+    def _read_csv_arrow(self, filepath: str) -> Optional[pd.DataFrame]:
+        """Read a CSV file with the pyarrow engine.
+
+        Returns None when the result would differ from a C engine read:
+        no rows, renamed headers (duplicate or blank), undecodable text, or
+        integers too large for float64. Inferred date, time and timestamp columns are
+        re-read as text, as the C engine leaves them.
+        """
+        df = pd.read_csv(filepath, engine="pyarrow")
+        # Without rows pyarrow types every column as float64
+        if df.empty or not df.columns.equals(pd.read_csv(filepath, nrows=0).columns):
+            return None
+        text_cols = []
+        for col in df.columns:
+            values = df[col]
+            if pd.api.types.is_datetime64_any_dtype(values):
+                text_cols.append(col)
+            elif values.dtype == object:
+                kind = pd.api.types.infer_dtype(values, skipna=True)
+                if kind == "bytes":
+                    return None
+                if kind in ("date", "time", "datetime"):
+                    text_cols.append(col)
+                elif kind == "boolean":
+                    # Missing values come back as None rather than NaN
+                    df[col] = values.where(values.notna(), np.nan)
+            elif values.dtype.kind == "f":
+                # pyarrow turns integers beyond int64 into lossy floats
+                arr = values.to_numpy()
+                arr = arr[~np.isnan(arr)]
+                if arr.size and np.abs(arr).max() >= 2 ** 53 and np.all(arr == np.round(arr)):
+                    return None
+        if text_cols:
+            # pyarrow parses before applying dtype, so read the raw text in C
+            df[text_cols] = pd.read_csv(filepath, usecols=text_cols, dtype=str)[text_cols]
+        return df
+
+    def _store(self, filepath: str, df: pd.DataFrame) -> str:
+        """Store a dataframe under a unique name derived from its path."""
+        path = Path(filepath)
+        stem = path.stem  # filename without extension
+        suffix = path.suffix  # file extension including dot
+        filename = path.name
+        # Ensure unique name by inserting counter before extension
+        counter = 1
+        while filename in self.dataframes:
+            filename = f"{stem}_{counter}{suffix}"
+            counter += 1
+        self.dataframes[filename] = df
+        self._col_counts.update(set(df.columns))
+        return filename
+
     def remove_csv(self, name: str) -> bool:
         """Remove a loaded CSV file."""
         if name in self.dataframes:
-            del self.dataframes[name]
+            df = self.dataframes.pop(name)
+            self._col_counts.subtract(set(df.columns))
+            self._col_counts = +self._col_counts
             return True
         return False
 
@@ -77,10 +290,7 @@ class DataManager:
 
     def get_all_columns(self) -> List[str]:
         """Get all unique column names across all dataframes."""
-        columns = set()
-        for df in self.dataframes.values():
-            columns.update(df.columns)
-        return sorted(list(columns))
+        return sorted(self._col_counts)
 
     def merge_data(self, merge_type: str, merge_on: Optional[str] = None) -> Tuple[bool, str]:
         """Merge all loaded dataframes based on the merge type."""
@@ -95,72 +305,140 @@ class DataManager:
             dfs = list(self.dataframes.values())
 
             if merge_type == "Concatenate (Stack Rows)":
-                self.merged_data = pd.concat(dfs, ignore_index=True)
+                result = pd.concat(dfs, ignore_index=True, sort=False, **CONCAT_NO_COPY)
             elif merge_type == "Concatenate (Side by Side)":
-                self.merged_data = pd.concat(dfs, axis=1)
-            elif merge_type == "Inner Join" and merge_on:
-                result = dfs[0]
-                for df in dfs[1:]:
-                    if merge_on in result.columns and merge_on in df.columns:
-                        result = result.merge(df, on=merge_on, how="inner")
-                self.merged_data = result
-            elif merge_type == "Outer Join" and merge_on:
-                result = dfs[0]
-                for df in dfs[1:]:
-                    if merge_on in result.columns and merge_on in df.columns:
-                        result = result.merge(df, on=merge_on, how="outer")
-                self.merged_data = result
-            elif merge_type == "Left Join" and merge_on:
-                result = dfs[0]
-                for df in dfs[1:]:
-                    if merge_on in result.columns and merge_on in df.columns:
-                        result = result.merge(df, on=merge_on, how="left")
-                self.merged_data = result
+                result = pd.concat(dfs, axis=1, sort=False, **CONCAT_NO_COPY)
+            elif merge_type in JOIN_TYPES and merge_on:
+                result = self._join_frames(dfs, merge_on, JOIN_TYPES[merge_type])
             else:
                 return False, "Invalid merge type or missing merge column"
 
+            # Only replace the previous result once the merge has succeeded
+            self.merged_data = result
             return True, f"Merged {len(dfs)} files successfully"
         except Exception as e:
             return False, str(e)
 
+    def _join_frames(self, dfs: List[pd.DataFrame], merge_on: str, how: str) -> pd.DataFrame:
+        """Join dataframes on a shared column.
+
+        Frames without the column are skipped. When the result is known to be
+        empty only the column schema is built. Inner and outer joins are done
+        in a single pass on the index when that matches merging; otherwise
+        the frames are merged one at a time.
+        """
+        if merge_on not in dfs[0].columns:
+            return dfs[0]
+        frames = [df for df in dfs if merge_on in df.columns]
+        if len(frames) == 1:
+            return frames[0]
+
+        # An empty input makes an inner join (or a left join with an empty
+        # left side) empty too, so only the column schema needs computing.
+        # Mixed key dtypes are left to merge, which decides whether they clash
+        same_keys = all(df[merge_on].dtype == frames[0][merge_on].dtype for df in frames)
+        if same_keys and ((how == "inner" and any(df.empty for df in frames)) or (
+                how == "left" and frames[0].empty)):
+            frames = [df.iloc[:0] for df in frames]
+
+        if not self._can_join_in_one_pass(frames, merge_on, how):
+            result = frames[0]
+            for df in frames[1:]:
+                result = result.merge(df, on=merge_on, how=how, sort=False)
+            return result
+
+        indexed = [df.set_index(merge_on) for df in frames]
+        # merge always returns outer joins sorted by key
+        result = indexed[0].join(indexed[1:], how=how, sort=how == "outer").reset_index()
+        # Put the key back where it was in the first frame, as merge does
+        columns = list(result.columns[1:])
+        columns.insert(frames[0].columns.get_loc(merge_on), merge_on)
+        return result[columns]
+
+    def _can_join_in_one_pass(self, frames: List[pd.DataFrame], merge_on: str,
+                              how: str) -> bool:
+        """Check whether a single index join gives the same result as merging.
+
+        Requires an inner or outer join, the same key dtype in every frame
+        (merge raises on incompatible keys), unique keys (join would merge
+        pairwise anyway, ordering duplicates differently) and no shared
+        non-key columns (merge would add suffixes).
+        """
+        if how not in ("inner", "outer"):
+            return False
+        key_dtype = frames[0][merge_on].dtype
+        seen = set()
+        for df in frames:
+            if df[merge_on].dtype != key_dtype or not df[merge_on].is_unique:
+                return False
+            columns = set(df.columns) - {merge_on}
+            if columns & seen:
+                return False
+            seen.update(columns)
+        return True
+
     def get_merged_columns(self) -> List[str]:
         """Get columns from merged data."""
-        if self.merged_data is not None:
-            return list(self.merged_data.columns)
-        return []
+        return list(self._merged_cols)
 
     def get_numeric_columns(self) -> List[str]:
         """Get numeric columns from merged data."""
-        if self.merged_data is not None:
-            return list(self.merged_data.select_dtypes(include=[np.number]).columns)
-        return []
+        return list(self._numeric_cols)
+
+    def index_array(self) -> Optional[np.ndarray]:
+        """Get the merged data's index as a NumPy array."""
+        return self._index_arr
 
 
 class PlotCanvas(FigureCanvas):
     """Matplotlib canvas for rendering plots."""
 
     def __init__(self, parent=None):
+        # Simplify and chunk long paths so dense lines render quickly
+        matplotlib.rcParams['path.simplify'] = True
+        matplotlib.rcParams['path.simplify_threshold'] = 1.0
+        matplotlib.rcParams['agg.path.chunksize'] = 10000
         self.fig = Figure(figsize=(8, 6), dpi=100)
         self.axes = self.fig.add_subplot(111)
         super().__init__(self.fig)
         self.setParent(parent)
+        # Key of the data layer currently drawn; the data is kept referenced
+        # so its id() cannot be reused by another frame
+        self._data_key = None
+        self._plotted_data = None
+        # Snapshot of the rendered axes, used to blit overlay updates
+        self._background = None
+        self._background_limits = None
+        self._crosshair = None
+        self.mpl_connect('draw_event', self._on_draw)
+        self.mpl_connect('motion_notify_event', self._on_mouse_move)
+        self.mpl_connect('axes_leave_event', self._on_axes_leave)
+        if _minmax_kernel is not None:
+            # Compile up front so the first large plot does not stall
+            _minmax_kernel(np.zeros(2), 1, 2, np.empty(3, dtype=np.int64))
 
     def clear_plot(self):
         """Clear the current plot."""
+        self._reset_data_key()
         self.axes.clear()
         self.fig.tight_layout()
-        self.draw()
+        self.draw_idle()
 
-    def update_plot(self, data: Optional[pd.DataFrame], config: dict):
-        """Update the plot with new data and configuration."""
-        self.axes.clear()
+    def update_plot(self, data: Optional[pd.DataFrame], config: dict,
+                    index: Optional[np.ndarray] = None):
+        """Update the plot with new data and configuration.
 
+        `index` optionally supplies the data's index as an array, used for
+        the X axis when no X column is selected.
+        """
         if data is None or data.empty:
+            self._reset_data_key()
+            self.axes.clear()
             self.axes.text(
                 0.5, 0.5, "No data to display",
                 ha='center', va='center', transform=self.axes.transAxes
             )
-            self.draw()
+            self.draw_idle()
             return
 
         plot_type = config.get("plot_type", "Line")
@@ -175,66 +453,114 @@ class PlotCanvas(FigureCanvas):
         line_style = config.get("line_style", "-")
         alpha = config.get("alpha", 1.0)
 
+        # Style-only changes reuse the plotted data and update it in place
+        data_key = (id(data), plot_type, x_column, tuple(y_columns), marker, line_style)
+        if y_columns and data_key == self._data_key:
+            try:
+                if plot_type != "Box":
+                    for artist in self.axes.lines + self.axes.collections + self.axes.patches:
+                        if self._crosshair is None or artist not in self._crosshair:
+                            artist.set_alpha(alpha)
+                self._apply_style(plot_type, title, xlabel, ylabel, grid, legend)
+                self.fig.tight_layout()
+                self.draw_idle()
+                return
+            except Exception:
+                pass  # Fall back to a full redraw
+
+        self._reset_data_key()
+        self.axes.clear()
+
         try:
             if not y_columns:
                 self.axes.text(
                     0.5, 0.5, "Please select Y column(s)",
                     ha='center', va='center', transform=self.axes.transAxes
                 )
-                self.draw()
+                self.draw_idle()
                 return
 
-            # Get X data
+            # Get X data once as an array shared by every series
             if x_column and x_column in data.columns:
-                x_data = data[x_column]
+                x_data = data[x_column].to_numpy()
+            elif index is not None and len(index) == len(data):
+                x_data = index
             else:
-                x_data = data.index
+                x_data = data.index.to_numpy()
+
+            # Long series are decimated before drawing
+            decimate = (
+                plot_type in ("Line", "Scatter", "Area")
+                and len(data) > DECIMATION_TARGET
+                and _is_monotonic_numeric(x_data)
+            )
+            x_values = np.asarray(x_data, dtype=float) if decimate else None
+
+            if plot_type == "Bar":
+                # Bars are limited in count and share positions across series
+                bar_x_data = x_data[:MAX_BAR_CHART_ITEMS]
+                bar_positions = np.arange(len(bar_x_data))
+                bar_labels = pd.Series(bar_x_data).astype(str).str.slice(0, 10)
+                # astype(str) may leave missing values as NaN; label them
+                # as str() does ("nan", "NaT", "None")
+                missing = pd.isna(bar_x_data)
+                if missing.any():
+                    bar_labels[missing] = [str(x)[:10] for x in bar_x_data[missing]]
 
             # Plot based on type
             for y_col in y_columns:
                 if y_col not in data.columns:
                     continue
-                y_data = data[y_col]
+                y_series = data[y_col]
+                y_data = y_series.to_numpy()
+                plot_x_data = x_data
+                if decimate:
+                    plot_x_data, y_data = _decimate(
+                        x_values, y_series.to_numpy(dtype=float, na_value=np.nan)
+                    )
+
+                rasterized = len(y_data) > RASTERIZE_MIN_POINTS
 
                 if plot_type == "Line":
                     self.axes.plot(
-                        x_data, y_data, marker=marker or None,
-                        linestyle=line_style, alpha=alpha, label=y_col
+                        plot_x_data, y_data, marker=marker or None,
+                        linestyle=line_style, alpha=alpha, label=y_col,
+                        rasterized=rasterized
                     )
                 elif plot_type == "Scatter":
-                    self.axes.scatter(x_data, y_data, alpha=alpha, label=y_col)
+                    self.axes.scatter(plot_x_data, y_data, alpha=alpha, label=y_col)
                 elif plot_type == "Bar":
-                    # For bar plots, limit data points and position bars side by side
-                    bar_x_data = x_data
-                    bar_y_data = y_data
-                    if len(bar_x_data) > MAX_BAR_CHART_ITEMS:
-                        bar_x_data = bar_x_data[:MAX_BAR_CHART_ITEMS]
-                        bar_y_data = bar_y_data[:MAX_BAR_CHART_ITEMS]
+                    # Position bars side by side
+                    bar_y_data = y_data[:MAX_BAR_CHART_ITEMS]
                     num_series = len(y_columns)
                     width = 0.8 / num_series
                     series_idx = y_columns.index(y_col)
                     offset = (series_idx - num_series / 2 + 0.5) * width
-                    x_positions = np.arange(len(bar_x_data)) + offset
                     self.axes.bar(
-                        x_positions, bar_y_data, width=width,
+                        bar_positions + offset, bar_y_data, width=width,
                         alpha=alpha, label=y_col
                     )
                     if y_col == y_columns[-1]:
-                        self.axes.set_xticks(np.arange(len(bar_x_data)))
+                        self.axes.set_xticks(bar_positions)
                         self.axes.set_xticklabels(
-                            [str(x)[:10] for x in bar_x_data],
+                            bar_labels.tolist(),
                             rotation=45, ha='right'
                         )
                 elif plot_type == "Histogram":
-                    self.axes.hist(y_data.dropna(), bins=30, alpha=alpha, label=y_col)
+                    if y_data.dtype.kind == "f":
+                        hist_data = y_data[~np.isnan(y_data)]
+                    else:
+                        hist_data = y_series.dropna().to_numpy()
+                    self.axes.hist(hist_data, bins=30, alpha=alpha, label=y_col)
                 elif plot_type == "Area":
                     # Use x_data if numeric, otherwise use index
                     if pd.api.types.is_numeric_dtype(x_data):
-                        area_x_data = x_data
+                        area_x_data = plot_x_data
                     else:
                         area_x_data = range(len(y_data))
                     self.axes.fill_between(
-                        area_x_data, y_data, alpha=alpha, label=y_col
+                        area_x_data, y_data, alpha=alpha, label=y_col,
+                        rasterized=rasterized
                     )
                 elif plot_type == "Box":
                     # For box plots, collect all y data
@@ -245,20 +571,12 @@ class PlotCanvas(FigureCanvas):
                 if box_data:
                     self.axes.boxplot(box_data, tick_labels=y_columns)
 
-            # Apply formatting
-            if title:
-                self.axes.set_title(title)
-            if xlabel:
-                self.axes.set_xlabel(xlabel)
-            if ylabel:
-                self.axes.set_ylabel(ylabel)
-            if grid:
-                self.axes.grid(True, alpha=0.3)
-            if legend and plot_type != "Box":
-                self.axes.legend()
+            self._apply_style(plot_type, title, xlabel, ylabel, grid, legend)
 
             self.fig.tight_layout()
-            self.draw()
+            self.draw_idle()
+            self._data_key = data_key
+            self._plotted_data = data
 
         except Exception as e:
             self.axes.text(
@@ -266,7 +584,80 @@ class PlotCanvas(FigureCanvas):
                 ha='center', va='center', transform=self.axes.transAxes,
                 color='red'
             )
-            self.draw()
+            self.draw_idle()
+
+    def _apply_style(self, plot_type: str, title: str, xlabel: str, ylabel: str,
+                     grid: bool, legend: bool):
+        """Apply titles, labels, grid and legend to the current axes."""
+        self.axes.set_title(title)
+        self.axes.set_xlabel(xlabel)
+        self.axes.set_ylabel(ylabel)
+        if grid:
+            self.axes.grid(True, alpha=0.3)
+        else:
+            self.axes.grid(False)
+        current_legend = self.axes.get_legend()
+        if current_legend is not None:
+            current_legend.remove()
+        if legend and plot_type != "Box":
+            self.axes.legend()
+
+    def _reset_data_key(self):
+        """Forget the plotted data so the next update redraws it."""
+        self._data_key = None
+        self._plotted_data = None
+        self._background = None
+
+    def _axes_limits(self) -> tuple:
+        """Get the current X and Y axis limits."""
+        return self.axes.get_xlim(), self.axes.get_ylim()
+
+    def _on_draw(self, event):
+        """Store the freshly rendered axes for later blitting."""
+        # savefig fires draw_event from its own canvas; ignore those renders
+        if event.canvas is not self:
+            return
+        self._background = self.copy_from_bbox(self.axes.bbox)
+        self._background_limits = self._axes_limits()
+
+    def update_overlay(self, artists: list):
+        """Redraw overlay artists on top of the last full render.
+
+        Artists should be created with animated=True so they are left out of
+        full renders. Falls back to a full redraw when the stored render is
+        missing or the axes limits have changed since it was taken.
+        """
+        if self._background is None or self._background_limits != self._axes_limits():
+            self.draw_idle()
+            return
+        self.restore_region(self._background)
+        for artist in artists:
+            self.axes.draw_artist(artist)
+        self.blit(self.axes.bbox)
+
+    def _crosshair_lines(self) -> tuple:
+        """Get the crosshair lines, recreating them after the axes are cleared."""
+        if self._crosshair is None or self._crosshair[0] not in self.axes.get_children():
+            # Added as plain artists so they do not rescale the axes
+            style = dict(color='gray', linewidth=0.8, animated=True)
+            vline = Line2D([0, 0], [0, 1], transform=self.axes.get_xaxis_transform(), **style)
+            hline = Line2D([0, 1], [0, 0], transform=self.axes.get_yaxis_transform(), **style)
+            self._crosshair = (self.axes.add_artist(vline), self.axes.add_artist(hline))
+        return self._crosshair
+
+    def _on_mouse_move(self, event):
+        """Move the crosshair to the cursor."""
+        if event.inaxes is not self.axes:
+            return
+        vline, hline = self._crosshair_lines()
+        vline.set_xdata([event.xdata, event.xdata])
+        hline.set_ydata([event.ydata, event.ydata])
+        self.update_overlay([vline, hline])
+
+    def _on_axes_leave(self, event):
+        """Hide the crosshair when the cursor leaves the axes."""
+        if event.inaxes is self.axes:
+            self.update_overlay([])
 
     def save_plot(self, filepath: str, dpi: int = DEFAULT_PLOT_DPI):
         """Save the current plot to a file."""
@@ -349,8 +740,7 @@ class FilePanel(QWidget):
             self, "Select CSV Files", "",
             "CSV Files (*.csv);;All Files (*)"
         )
-        for filepath in files:
-            success, result = self.data_manager.load_csv(filepath)
+        for filepath, success, result in self.data_manager.load_many(files):
             if success:
                 self.file_list.addItem(result)
             else:
@@ -406,6 +796,14 @@ class PlotConfigPanel(QWidget):
     def __init__(self, data_manager: DataManager):
         super().__init__()
         self.data_manager = data_manager
+        # Coalesces bursts of edits (typing, spinning) into one emission
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(CONFIG_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self.emit_config)
+        # Columns last shown, so unchanged lists are not rebuilt
+        self._last_columns: Tuple[str, ...] = ()
+        self._last_numeric_columns: Tuple[str, ...] = ()
         self.setup_ui()
 
     def setup_ui(self):
@@ -454,19 +852,19 @@ class PlotConfigPanel(QWidget):
         label_layout.addWidget(QLabel("Title:"))
         self.title_edit = QLineEdit()
         self.title_edit.setPlaceholderText("Plot Title")
-        self.title_edit.textChanged.connect(self.emit_config)
+        self.title_edit.textChanged.connect(self.schedule_config)
         label_layout.addWidget(self.title_edit)
 
         label_layout.addWidget(QLabel("X Label:"))
         self.xlabel_edit = QLineEdit()
         self.xlabel_edit.setPlaceholderText("X Axis Label")
-        self.xlabel_edit.textChanged.connect(self.emit_config)
+        self.xlabel_edit.textChanged.connect(self.schedule_config)
         label_layout.addWidget(self.xlabel_edit)
 
         label_layout.addWidget(QLabel("Y Label:"))
         self.ylabel_edit = QLineEdit()
         self.ylabel_edit.setPlaceholderText("Y Axis Label")
-        self.ylabel_edit.textChanged.connect(self.emit_config)
+        self.ylabel_edit.textChanged.connect(self.schedule_config)
         label_layout.addWidget(self.ylabel_edit)
 
         scroll_layout.addWidget(label_group)
@@ -480,7 +878,7 @@ class PlotConfigPanel(QWidget):
         line_layout.addWidget(QLabel("Line Style:"))
         self.line_style_combo = QComboBox()
         self.line_style_combo.addItems(["-", "--", "-.", ":", ""])
-        self.line_style_combo.currentTextChanged.connect(self.emit_config)
+        self.line_style_combo.currentTextChanged.connect(self.schedule_config)
         line_layout.addWidget(self.line_style_combo)
         style_layout.addLayout(line_layout)
 
@@ -489,7 +887,7 @@ class PlotConfigPanel(QWidget):
         marker_layout.addWidget(QLabel("Marker:"))
         self.marker_combo = QComboBox()
         self.marker_combo.addItems(["", "o", "s", "^", "v", "D", "*", "+", "x"])
-        self.marker_combo.currentTextChanged.connect(self.emit_config)
+        self.marker_combo.currentTextChanged.connect(self.schedule_config)
         marker_layout.addWidget(self.marker_combo)
         style_layout.addLayout(marker_layout)
 
@@ -500,20 +898,20 @@ class PlotConfigPanel(QWidget):
         self.alpha_spin.setRange(0.1, 1.0)
         self.alpha_spin.setSingleStep(0.1)
         self.alpha_spin.setValue(1.0)
-        self.alpha_spin.valueChanged.connect(self.emit_config)
+        self.alpha_spin.valueChanged.connect(self.schedule_config)
         alpha_layout.addWidget(self.alpha_spin)
         style_layout.addLayout(alpha_layout)
 
         # Grid
         self.grid_check = QCheckBox("Show Grid")
         self.grid_check.setChecked(True)
-        self.grid_check.stateChanged.connect(self.emit_config)
+        self.grid_check.stateChanged.connect(self.schedule_config)
         style_layout.addWidget(self.grid_check)
 
         # Legend
         self.legend_check = QCheckBox("Show Legend")
         self.legend_check.setChecked(True)
-        self.legend_check.stateChanged.connect(self.emit_config)
+        self.legend_check.stateChanged.connect(self.schedule_config)
         style_layout.addWidget(self.legend_check)
 
         scroll_layout.addWidget(style_group)
@@ -528,25 +926,29 @@ class PlotConfigPanel(QWidget):
         current_x = self.x_combo.currentText()
         current_y = [item.text() for item in self.y_list.selectedItems()]
 
-        # Update X combo
-        self.x_combo.clear()
-        self.x_combo.addItem("(Index)")
-        columns = self.data_manager.get_merged_columns()
-        self.x_combo.addItems(columns)
-
-        # Restore X selection if possible
-        idx = self.x_combo.findText(current_x)
-        if idx >= 0:
-            self.x_combo.setCurrentIndex(idx)
-
-        # Update Y list
-        self.y_list.clear()
-        numeric_columns = self.data_manager.get_numeric_columns()
-        for col in numeric_columns:
-            item = QListWidgetItem(col)
-            self.y_list.addItem(item)
-            if col in current_y:
-                item.setSelected(True)
+        # Update X combo, unless its columns are unchanged
+        columns = tuple(self.data_manager.get_merged_columns())
+        if columns != self._last_columns:
+            self._last_columns = columns
+            self.x_combo.clear()
+            self.x_combo.addItem("(Index)")
+            self.x_combo.addItems(columns)
+
+            # Restore X selection if possible
+            idx = self.x_combo.findText(current_x)
+            if idx >= 0:
+                self.x_combo.setCurrentIndex(idx)
+
+        # Update Y list, unless its columns are unchanged
+        numeric_columns = tuple(self.data_manager.get_numeric_columns())
+        if numeric_columns != self._last_numeric_columns:
+            self._last_numeric_columns = numeric_columns
+            self.y_list.clear()
+            for col in numeric_columns:
+                item = QListWidgetItem(col)
+                self.y_list.addItem(item)
+                if col in current_y:
+                    item.setSelected(True)
 
     def get_config(self) -> dict:
         """Get current plot configuration."""
@@ -572,8 +974,39 @@ class PlotConfigPanel(QWidget):
 
     def emit_config(self):
         """Emit the current configuration."""
+        self._debounce.stop()
         self.config_changed.emit(self.get_config())
 
+    def schedule_config(self):
+        """Emit the configuration once edits pause."""
+        self._debounce.start()
+
+
+class SaveSignals(QObject):
+    """Signals reporting the outcome of a background plot save."""
+
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str, str)
+
+
+class SaveTask(QRunnable):
+    """Renders a pickled figure to a file on a worker thread."""
+
+    def __init__(self, fig_data: bytes, filepath: str, dpi: int = DEFAULT_PLOT_DPI):
+        super().__init__()
+        self.fig_data = fig_data
+        self.filepath = filepath
+        self.dpi = dpi
+        self.signals = SaveSignals()
+
+    def run(self):
+        try:
+            fig = pickle.loads(self.fig_data)
+            fig.savefig(self.filepath, dpi=self.dpi, bbox_inches='tight')
+            self.signals.saved.emit(self.filepath)
+        except Exception as e:
+            self.signals.failed.emit(self.filepath, str(e))
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -581,6 +1014,8 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.data_manager = DataManager()
+        # Signal objects of saves still running, kept alive until they report
+        self._pending_saves = set()
         self.setup_ui()
         self.setup_menu()
         self.connect_signals()
@@ -696,7 +1131,9 @@ class MainWindow(QMainWindow):
 
     def update_plot(self, config: dict):
         """Update the plot with current configuration."""
-        self.canvas.update_plot(self.data_manager.merged_data, config)
+        self.canvas.update_plot(
+            self.data_manager.merged_data, config, self.data_manager.index_array()
+        )
 
     def save_plot(self, format_type: str):
         """Save the current plot to a file."""
@@ -712,13 +1149,39 @@ class MainWindow(QMainWindow):
             f"plot{default_ext}", filter_str
         )
 
-        if filepath:
+        if not filepath:
+            return
+
+        try:
+            fig_data = pickle.dumps(self.canvas.fig)
+        except Exception:
+            # Figure cannot be copied, save it on the GUI thread instead
             try:
                 self.canvas.save_plot(filepath)
-                self.statusBar.showMessage(f"Plot saved to {filepath}")
-                QMessageBox.information(self, "Success", f"Plot saved to:\n{filepath}")
+                self.on_plot_saved(filepath)
             except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to save plot: {str(e)}")
+                self.on_plot_save_failed(filepath, str(e))
+            return
+
+        task = SaveTask(fig_data, filepath)
+        signals = task.signals
+        self._pending_saves.add(signals)
+        signals.saved.connect(self.on_plot_saved)
+        signals.failed.connect(self.on_plot_save_failed)
+        signals.saved.connect(lambda *_: self._pending_saves.discard(signals))
+        signals.failed.connect(lambda *_: self._pending_saves.discard(signals))
+        self.statusBar.showMessage(f"Saving plot to {filepath}...")
+        QThreadPool.globalInstance().start(task)
+
+    def on_plot_saved(self, filepath: str):
+        """Report a successfully saved plot."""
+        self.statusBar.showMessage(f"Plot saved to {filepath}")
+        QMessageBox.information(self, "Success", f"Plot saved to:\n{filepath}")
+
+    def on_plot_save_failed(self, filepath: str, error: str):
+        """Report a failed plot save."""
+        self.statusBar.showMessage(f"Failed to save plot to {filepath}")
+        QMessageBox.critical(self, "Error", f"Failed to save plot: {error}")
 
     def show_about(self):
         """Show about dialog."""